@@ -1,111 +1,230 @@
 import argparse
-import yaml
+import importlib
+import json
+import os
+import re
+import sys
 import calendar
-from datetime import datetime, date
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+from datetime import date, timedelta
+from io import BytesIO
+
+# yaml, reportlab, numpy and concurrent.futures are imported where they are used, so that
+# --help, --template and runs served from the config cache don't pay for importing them.
+
+MIN_MONTHS_FOR_POOL = 3  # Fewer months than this are rendered serially
+# Recurring events x printed months from which the NumPy expansion pays for importing NumPy
+# (~65 ms).  Below it, or for fewer than NUMPY_MIN_MONTHS months (where NumPy's per-event
+# overhead dominates), the pure-Python expansion is faster.
+NUMPY_MIN_EVENT_MONTHS = 200_000
+NUMPY_MIN_MONTHS = 36
+
+def _import_optional(name):
+    """Returns the named module, or None if that optional dependency isn't installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 # --- Configuration Validation Functions ---
 
-def is_valid_date(date_str, date_format="%Y-%m-%d"):
-    """Checks if a date string is valid and matches the given format."""
+# Recurrence strings are a positive count followed by a unit: 'w'eeks, 'm'onths or 'y'ears.
+_RECURRENCE_RE = re.compile(r'0*([1-9][0-9]*)([wmy])')
+
+def is_valid_date(date_str):
+    """Checks if a date string is a valid 'YYYY-MM-DD' date."""
+    # date.fromisoformat also takes other ISO 8601 shapes (e.g. '20250103', '2025-W01-1') on
+    # Python 3.11+, so pin the shape down first.
+    if not isinstance(date_str, str) or len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return False
     try:
-        datetime.strptime(date_str, date_format)
+        date.fromisoformat(date_str)
         return True
     except ValueError:
         return False
 
-def validate_config(config):
-    """Validates the structure and content of the configuration data."""
-    errors = []
+def is_valid_month(month_str):
+    """Checks if a month string is a valid 'YYYY-MM' month."""
+    return isinstance(month_str, str) and is_valid_date(month_str + "-01")  # Add "-01" for day
+
+# Keys every event of each kind must have.
+_SINGLE_EVENT_KEYS = frozenset(('date', 'description'))
+_RECURRING_EVENT_KEYS = frozenset(('recurrence', 'start_date', 'description'))
+
+def validate_config(config, fail_fast=False):
+    """
+    Validates the structure and content of the configuration data.
+
+    Returns a list of error messages, empty if the config is valid.  With fail_fast,
+    validation stops at the first error and at most one message is returned.
+    """
+    errors = _iter_config_errors(config)
+    if fail_fast:
+        return list(islice(errors, 1))
+    return list(errors)
+
+def _iter_config_errors(config):
+    """Yields a message for each problem found in the configuration data."""
+    if not isinstance(config, dict):
+        yield "Config file must contain a mapping with 'months_to_print' and 'events' keys."
+        return
 
     # Check for required top-level keys
     if 'months_to_print' not in config:
-        errors.append("Missing 'months_to_print' key in config file.")
+        yield "Missing 'months_to_print' key in config file."
     if 'events' not in config:
-        errors.append("Missing 'events' key in config file.")
+        yield "Missing 'events' key in config file."
 
     # Validate months_to_print
     if 'months_to_print' in config:
-        if not isinstance(config['months_to_print'], list):
-            errors.append("'months_to_print' must be a list.")
+        months = config['months_to_print']
+        if not isinstance(months, list):
+            yield "'months_to_print' must be a list."
         else:
-            for month_str in config['months_to_print']:
-                if not is_valid_date(month_str + "-01", "%Y-%m-%d"):  # Add "-01" for day
-                    errors.append(f"Invalid month format: '{month_str}'. Use '%Y-%m'.")
+            for month_str in months:
+                if not is_valid_month(month_str):
+                    yield f"Invalid month format: '{month_str}'. Use '%Y-%m'."
 
     # Validate events
-    if 'events' in config:
-        if not isinstance(config['events'], dict):
-            errors.append("'events' must be a dictionary.")
+    if 'events' not in config:
+        return
+    events = config['events']
+    if not isinstance(events, dict):
+        yield "'events' must be a dictionary."
+        return
+
+    # Validate single_events
+    if 'single_events' in events:
+        single_events = events['single_events']
+        if not isinstance(single_events, list):
+            yield "'single_events' must be a list."
         else:
-            # Validate single_events
-            if 'single_events' in config['events']:
-                if not isinstance(config['events']['single_events'], list):
-                    errors.append("'single_events' must be a list.")
-                else:
-                    for event in config['events']['single_events']:
-                        if not isinstance(event, dict):
-                            errors.append("Each entry in 'single_events' must be a dictionary.")
-                            continue
-                        if 'date' not in event or 'description' not in event:
-                            errors.append("Each single event must have 'date' and 'description' keys.")
-                            continue
-                        if not is_valid_date(event['date']):
-                            errors.append(f"Invalid date format: '{event['date']}'. Use '%Y-%m-%d'.")
-                        if not isinstance(event['description'], str):
-                            errors.append(f"Description must be a string: '{event['description']}'.")
-
-            # Validate recurring_events
-            if 'recurring_events' in config['events']:
-                if not isinstance(config['events']['recurring_events'], list):
-                    errors.append("'recurring_events' must be a list.")
-                else:
-                    for event in config['events']['recurring_events']:
-                        if not isinstance(event, dict):
-                            errors.append("Each entry in 'recurring_events' must be a dictionary.")
-                            continue
-                        if 'recurrence' not in event or 'start_date' not in event or 'description' not in event:
-                            errors.append("Each recurring event must have 'recurrence', 'start_date', and 'description' keys.")
-                            continue
-                        if not isinstance(event['recurrence'], str) or not (event['recurrence'].endswith('w') or event['recurrence'].endswith('m') or event['recurrence'].endswith('y')) or not event['recurrence'][:-1].isdigit():
-                            errors.append(f"Invalid recurrence format: '{event['recurrence']}'. Use 'nW', 'nM', or 'nY'.")
-                        if not is_valid_date(event['start_date']):
-                            errors.append(f"Invalid start_date format: '{event['start_date']}'. Use '%Y-%m-%d'.")
-                        if 'end_date' in event and not is_valid_date(event['end_date']):
-                            errors.append(f"Invalid end_date format: '{event['end_date']}'. Use '%Y-%m-%d'.")
-                        if not isinstance(event['description'], str):
-                           errors.append(f"Description must be a string: '{event['description']}'.")
-
-
-    return errors
+            for event in single_events:
+                if not isinstance(event, dict):
+                    yield "Each entry in 'single_events' must be a dictionary."
+                    continue
+                if _SINGLE_EVENT_KEYS - event.keys():
+                    yield "Each single event must have 'date' and 'description' keys."
+                    continue
+                if not is_valid_date(event['date']):
+                    yield f"Invalid date format: '{event['date']}'. Use '%Y-%m-%d'."
+                if not isinstance(event['description'], str):
+                    yield f"Description must be a string: '{event['description']}'."
+
+    # Validate recurring_events
+    if 'recurring_events' in events:
+        recurring_events = events['recurring_events']
+        if not isinstance(recurring_events, list):
+            yield "'recurring_events' must be a list."
+        else:
+            for event in recurring_events:
+                if not isinstance(event, dict):
+                    yield "Each entry in 'recurring_events' must be a dictionary."
+                    continue
+                if _RECURRING_EVENT_KEYS - event.keys():
+                    yield "Each recurring event must have 'recurrence', 'start_date', and 'description' keys."
+                    continue
+                recurrence = event['recurrence']
+                if not isinstance(recurrence, str) or not _RECURRENCE_RE.fullmatch(recurrence):
+                    yield f"Invalid recurrence format: '{recurrence}'. Use 'nW', 'nM', or 'nY'."
+                if not is_valid_date(event['start_date']):
+                    yield f"Invalid start_date format: '{event['start_date']}'. Use '%Y-%m-%d'."
+                end_date = event.get('end_date')
+                if end_date is not None and not is_valid_date(end_date):
+                    yield f"Invalid end_date format: '{end_date}'. Use '%Y-%m-%d'."
+                if not isinstance(event['description'], str):
+                    yield f"Description must be a string: '{event['description']}'."
+
+def prepare_events(events):
+    """
+    Parses event fields once, storing them on each event.
+
+    Single events get '_date'.  Recurring events get '_start', '_end' (None if open-ended),
+    '_rnum' (recurrence count) and '_runit' ('w', 'm' or 'y').  Descriptions are interned,
+    so every occurrence in the event index shares one string object.
+    """
+    for event in events.get('single_events', []):
+        event['_date'] = date.fromisoformat(event['date'])
+        event['description'] = sys.intern(event['description'])
+    for event in events.get('recurring_events', []):
+        event['description'] = sys.intern(event['description'])
+        event['_start'] = date.fromisoformat(event['start_date'])
+        end_date = event.get('end_date')
+        event['_end'] = None if end_date is None else date.fromisoformat(end_date)
+        match = _RECURRENCE_RE.fullmatch(event['recurrence'])
+        event['_rnum'], event['_runit'] = int(match.group(1)), match.group(2)
+
+# --- Parsed Config Cache ---
+
+# Bump whenever validation or the cached layout changes, so caches validated by older rules
+# are treated as misses instead of being trusted.
+CACHE_VERSION = 2
+
+def cache_path_for(config_file):
+    """Returns the path of the JSON cache kept next to a YAML config file."""
+    return config_file + ".cache.json"
+
+def load_cached_config(config_file):
+    """
+    Returns the cached, already validated config, or None if there is no usable cache.
+
+    The cache is only used if it was written by this CACHE_VERSION from the YAML file's
+    current modification time.
+    """
+    cache = cache_path_for(config_file)
+    try:
+        with open(cache, 'r') as f:
+            cached = json.load(f)
+        if cached['__version'] != CACHE_VERSION or cached['__source_mtime'] != os.path.getmtime(config_file):
+            return None
+        return cached['config']
+    except (OSError, ValueError, TypeError, KeyError):
+        return None  # Missing, stale or unreadable cache; fall back to the YAML.
+
+def write_cached_config(config_file, config, source_mtime):
+    """Writes a validated config to the JSON cache.  Failures are not fatal."""
+    cache = cache_path_for(config_file)
+    try:
+        with open(cache, 'w') as f:
+            json.dump({'__version': CACHE_VERSION, '__source_mtime': source_mtime, 'config': config}, f)
+    except (OSError, TypeError, ValueError):
+        # Unwritable directory or values JSON can't represent; just skip caching.
+        try:
+            os.remove(cache)
+        except OSError:
+            pass
 
 # --- YAML Template Generation ---
 
+# Template config file contents, written as-is so --template needs no YAML emitter.
+_TEMPLATE_YAML = """\
+months_to_print:
+- 2025-01
+- 2025-02
+events:
+  single_events:
+  - date: '2025-01-01'
+    description: New Year's Day
+  - date: '2025-02-14'
+    description: Valentine's Day
+  recurring_events:
+  - recurrence: 1w
+    start_date: '2025-01-06'
+    description: Weekly Meeting
+    end_date: '2025-03-31'
+  - recurrence: 1m
+    start_date: '2025-01-15'
+    description: Monthly Report Due
+"""
+
 def create_template_config(filename="template_config.yaml"):
     """Generates a template YAML config file."""
 
-    template = {
-        'months_to_print': [
-            '2025-01',
-            '2025-02'
-        ],
-        'events': {
-            'single_events': [
-                {'date': '2025-01-01', 'description': 'New Year\'s Day'},
-                {'date': '2025-02-14', 'description': 'Valentine\'s Day'}
-            ],
-            'recurring_events': [
-                {'recurrence': '1w', 'start_date': '2025-01-06', 'description': 'Weekly Meeting', 'end_date': '2025-03-31'},
-                {'recurrence': '1m', 'start_date': '2025-01-15', 'description': 'Monthly Report Due'}
-            ]
-        }
-    }
     try:
         with open(filename, 'w') as f:
-            yaml.dump(template, f, indent=2, sort_keys=False)
+            f.write(_TEMPLATE_YAML)
         print(f"Template config file created: {filename}")
     except Exception as e:
         print(f"Error creating template config file: {e}")
@@ -113,127 +232,335 @@ def create_template_config(filename="template_config.yaml"):
 
 # --- PDF Generation Functions ---
 
-def create_calendar_page(canvas, year, month, events):
-    """Creates a single calendar page on the given ReportLab canvas."""
+WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+
+INCH = 72.0  # Points per inch; same value as reportlab.lib.units.inch
+
+_CAL = calendar.Calendar(firstweekday=6)  # Weeks start on Sunday
+
+@lru_cache(maxsize=None)
+def _month_weeks(year, month):
+    """Returns the (cached) weeks of a month as 7-tuples of dates, with None for days outside the month."""
+    # Built from day numbers rather than itermonthdates, which would need the padding days of
+    # the adjacent months and fails past date.max (e.g. for 9999-12).
+    return tuple(
+        tuple(date(year, month, day) if day else None for day in week)
+        for week in _CAL.monthdayscalendar(year, month)
+    )
 
-    # Page setup
-    canvas.setPageSize(landscape(letter))
-    canvas.setFont("Helvetica", 12)
+# Page layout shared by every month; see make_page_geom.
+PageGeom = namedtuple('PageGeom', [
+    'page_width', 'page_height', 'margin', 'cell_width', 'cell_height',
+    'x_start', 'y_start', 'weekday_positions',
+])
+
+def make_page_geom(pagesize):
+    """Computes the page layout once for the given page size."""
 
     # Dimensions and margins
-    page_width, page_height = landscape(letter)
-    margin = inch
+    page_width, page_height = pagesize
+    margin = INCH
     cell_width = (page_width - 2 * margin) / 7
     cell_height = (page_height - 2 * margin) / 7  #  row for weekdays
-    header_height = 0.5 * inch #seperate header
+    header_height = 0.5 * INCH #seperate header
     x_start = margin
     y_start = page_height - margin - header_height
 
-    # Month title
-    canvas.setFont("Helvetica-Bold", 24)
-    canvas.drawString(x_start, page_height - margin + 0.25 * inch, calendar.month_name[month] + " " + str(year)) #move title
-    #y_start -= 0.5 * inch  # Space after title REMOVE
+    # Weekday header x positions (starting with Sunday)
+    weekday_positions = tuple(x_start + i * cell_width + 0.2 * INCH for i in range(len(WEEKDAYS))) #shift
 
+    return PageGeom(page_width, page_height, margin, cell_width, cell_height, x_start, y_start, weekday_positions)
 
-    # Weekday headers (starting with Sunday)
-    canvas.setFont("Helvetica-Bold", 12)
-    weekdays = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
-    for i, day in enumerate(weekdays):
-        x = x_start + i * cell_width
-        canvas.drawString(x + 0.2 * inch, y_start + 0.2 * inch, day) #shift
+def create_calendar_page(canvas, year, month, month_events, geom):
+    """Creates a single calendar page on the given ReportLab canvas."""
+    cell_width = geom.cell_width
+    cell_height = geom.cell_height
+    x_start = geom.x_start
+    y_start = geom.y_start
 
-    #y_start -= cell_height #No need to subtract here
+    # Month title
+    canvas.setFont("Helvetica-Bold", 24)
+    canvas.drawString(x_start, geom.page_height - geom.margin + 0.25 * INCH, calendar.month_name[month] + " " + str(year)) #move title
+
+    # Weekday headers (starting with Sunday), as one text object
+    headers = canvas.beginText()
+    headers.setFont("Helvetica-Bold", 12)
+    for x, day in zip(geom.weekday_positions, WEEKDAYS):
+        headers.setTextOrigin(x, y_start + 0.2 * INCH) #shift
+        headers.textOut(day)
+    canvas.drawText(headers)
 
      # Get calendar data (starting with Sunday)
-    cal_instance = calendar.Calendar(firstweekday=6)
-    cal = cal_instance.monthdayscalendar(year, month)
+    cal = _month_weeks(year, month)
 
-    # Draw calendar grid and numbers
-    canvas.setFont("Helvetica", 10)
+    # Draw calendar grid as one path: 8 vertical lines and one horizontal line per week edge.
+    x_end = x_start + 7 * cell_width
+    y_end = y_start - len(cal) * cell_height
+    grid = canvas.beginPath()
+    for i in range(8):
+        x = x_start + i * cell_width
+        grid.moveTo(x, y_start)
+        grid.lineTo(x, y_end)
+    for j in range(len(cal) + 1):
+        y = y_start - j * cell_height
+        grid.moveTo(x_start, y)
+        grid.lineTo(x_end, y)
+    canvas.drawPath(grid, stroke=1, fill=0)
+
+    # Draw day numbers and events, each batched into one text object for the page
+    numbers = canvas.beginText()
+    numbers.setFont("Helvetica", 10)
+    events_text = canvas.beginText()
+    events_text.setFont("Helvetica", 8)  # Changed font size to 8
+    events_text.setLeading(0.15 * INCH)
     y = y_start
     for week in cal:
         x = x_start
-        for day in week:
-            # Draw cell rectangle
-            canvas.rect(x, y-cell_height, cell_width, cell_height) #shift
-
-            # Draw day number
-            if day != 0:
-                canvas.drawString(x + 0.1 * inch, y + cell_height - 0.2 * inch - cell_height, str(day)) #Shift
+        for day_date in week:
+            # Draw day number; cells outside the month stay blank
+            if day_date is not None:
+                numbers.setTextOrigin(x + 0.1 * INCH, y + cell_height - 0.2 * INCH - cell_height) #Shift
+                numbers.textOut(str(day_date.day))
                 # Lookup if this is in the events, and render.
-                date_str = f"{year}-{month:02}-{day:02}"
-                draw_events_for_date(canvas, events, date_str, x, y-cell_height, cell_width, cell_height) #Shift
+                draw_events_for_date(events_text, month_events, day_date, x, y-cell_height, cell_width, cell_height) #Shift
 
             x += cell_width
         y -= cell_height
+    canvas.drawText(numbers)
+    canvas.drawText(events_text)
 
-def draw_events_for_date(canvas, events, date_str, x, y, cell_width, cell_height):
+def build_event_index(events, months):
     """
-    Draws events for a given date on the canvas.  Handles stacking and basic truncation.
+    Expands single and recurring events into a lookup of the days they fall on.
 
     Args:
-        canvas: Reportlab canvas
-        events: Dict of events from config
-        date_str: "YYYY-MM-DD" string of day to render
-        x: top-left x
-        y: top-left y
-        cell_width: Day cell width
-        cell_height: Day cell height
+        events: Dict of events from config, after prepare_events
+        months: List of "YYYY-MM" strings that will be printed
 
+    Returns:
+        Dict mapping (year, month) to that month's events, as a dict of date objects to the
+        list of event descriptions on that day.  Months without events have no entry.
+        Single events come first, then recurring events, each in config order.
     """
 
-    event_strings = [] # Array of strings to write
+    index = {}
 
     # Single Events first
-    if 'single_events' in events:
-        for event in events['single_events']:
-            if event['date'] == date_str:
-                event_strings.append(event['description'])
+    for event in events.get('single_events', []):
+        _add_occurrence(index, event['_date'], event['description'])
 
     # Recurring Events second.
-    if 'recurring_events' in events:
-        for event in events['recurring_events']:
-            start_date_obj = datetime.strptime(event['start_date'], '%Y-%m-%d').date()
+    recurring = []
+    for event in events.get('recurring_events', []):
+        recurring.append((event['_start'], event['_end'], event['_rnum'], event['_runit'], event['description']))
+
+    months = [tuple(map(int, month_str.split('-'))) for month_str in dict.fromkeys(months)]  # Skip repeated months
+    if recurring and months:
+        np = _import_optional('numpy') if _numpy_pays_off(recurring, months) else None
+        if np is not None:
+            _index_recurring_numpy(np, index, recurring, months)
+        else:
+            _index_recurring_python(index, recurring, months)
 
-            #check end_date
-            if 'end_date' in event:
-                end_date_obj = datetime.strptime(event['end_date'], '%Y-%m-%d').date()
+    return index
+
+def _numpy_pays_off(recurring, months):
+    """Decides, before importing NumPy, whether the NumPy expansion is worth it for this workload."""
+    if len(months) < NUMPY_MIN_MONTHS or len(recurring) * len(months) < NUMPY_MIN_EVENT_MONTHS:
+        return False
+    # The NumPy path expands every event over the whole printed window, so the printed
+    # months have to cover most of it.
+    (first_year, first_month), (last_year, last_month) = min(months), max(months)
+    span = (last_year - first_year) * 12 + (last_month - first_month) + 1
+    return span <= 2 * len(months)
+
+def _add_occurrence(index, day_date, description):
+    """Adds one event description to the index under its month and day."""
+    index.setdefault((day_date.year, day_date.month), {}).setdefault(day_date, []).append(description)
+
+def _weekly_between(start_date_obj, recurrence_num, first, last):
+    """Yields weekly occurrences between first and last."""
+    step = recurrence_num * 7
+    # Round up to the first occurrence on or after 'first'.  Stepping over day offsets rather
+    # than dates never builds a date past 'last', which may be date.max.
+    first_offset = -(-(first - start_date_obj).days // step) * step
+    last_offset = (last - start_date_obj).days
+    for offset in range(first_offset, last_offset + 1, step):
+        yield start_date_obj + timedelta(days=offset)
+
+def _monthly_in_month(start_date_obj, recurrence_num, year, month, days_in_month):
+    """Returns the monthly occurrence in the given month, or None."""
+    #For monthly, we want same *day number*.  So, 5th of every month.
+    month_diff = (year - start_date_obj.year) * 12 + (month - start_date_obj.month)
+    if month_diff % recurrence_num == 0 and start_date_obj.day <= days_in_month:
+        return date(year, month, start_date_obj.day)
+    return None
+
+def _yearly_in_month(start_date_obj, recurrence_num, year, month, days_in_month):
+    """Returns the yearly occurrence in the given month, or None."""
+    year_diff = year - start_date_obj.year
+    if month == start_date_obj.month and year_diff % recurrence_num == 0 and start_date_obj.day <= days_in_month:
+        return date(year, month, start_date_obj.day)
+    return None
+
+def _index_recurring_python(index, recurring, months):
+    """Adds recurring event occurrences to the index, one printed month at a time."""
+    for year, month in months:
+        days_in_month = calendar.monthrange(year, month)[1]
+        month_start = date(year, month, 1)
+        month_end = date(year, month, days_in_month)
+
+        # Only events whose [start_date, end_date] window overlaps this month can occur in it.
+        active = [event for event in recurring
+                  if event[0] <= month_end and (event[1] is None or event[1] >= month_start)]
+
+        for start_date_obj, end_date_obj, recurrence_num, recurrence_unit, description in active:
+            first = max(start_date_obj, month_start)
+            last = month_end if end_date_obj is None else min(end_date_obj, month_end)
+
+            if recurrence_unit == 'w':
+                for current_date_obj in _weekly_between(start_date_obj, recurrence_num, first, last):
+                    _add_occurrence(index, current_date_obj, description)
+                continue
+            if recurrence_unit == 'm':
+                current_date_obj = _monthly_in_month(start_date_obj, recurrence_num, year, month, days_in_month)
             else:
-                end_date_obj = None
+                current_date_obj = _yearly_in_month(start_date_obj, recurrence_num, year, month, days_in_month)
+            # The end_date may fall earlier in the month than the occurrence.
+            if current_date_obj is not None and first <= current_date_obj <= last:
+                _add_occurrence(index, current_date_obj, description)
+
+def _index_recurring_numpy(np, index, recurring, months):
+    """Adds recurring event occurrences to the index, expanding each event with one NumPy arange."""
+    printed = set(months)
+    first_year, first_month = min(months)
+    last_year, last_month = max(months)
+    window_start = date(first_year, first_month, 1)
+    window_end = date(last_year, last_month, calendar.monthrange(last_year, last_month)[1])
+
+    for start_date_obj, end_date_obj, recurrence_num, recurrence_unit, description in recurring:
+        first = max(start_date_obj, window_start)
+        last = window_end if end_date_obj is None else min(end_date_obj, window_end)
+        if first > last:
+            continue
+        start = np.datetime64(start_date_obj, 'D')
+        first, last = np.datetime64(first, 'D'), np.datetime64(last, 'D')
+
+        # Offsets are computed with Python ints and the step is clamped to the window, so a
+        # recurrence longer than the window (even past int64) yields at most one occurrence.
+        if recurrence_unit == 'w':
+            step = recurrence_num * 7
+            # Round up to the first occurrence on or after 'first'.
+            first_offset = -(-int((first - start) // np.timedelta64(1, 'D')) // step) * step
+            last_offset = int((last - start) // np.timedelta64(1, 'D'))
+            if first_offset > last_offset:
+                continue
+            step = min(step, last_offset - first_offset + 1)
+            occurrences = np.arange(start + first_offset, start + last_offset + 1, step)
+        else:
+            # Step whole months (or years), then put the start day back onto each one.
+            unit = 'M' if recurrence_unit == 'm' else 'Y'
+            start_period = start.astype(f'datetime64[{unit}]')
+            first_offset = -(-int((first.astype(f'datetime64[{unit}]') - start_period).astype(int)) // recurrence_num) * recurrence_num
+            last_offset = int((last.astype(f'datetime64[{unit}]') - start_period).astype(int))
+            if first_offset > last_offset:
+                continue
+            step = min(recurrence_num, last_offset - first_offset + 1)
+            periods = np.arange(start_period + first_offset, start_period + last_offset + 1, step)
+            months_of = periods.astype('datetime64[M]')
+            if unit == 'Y':
+                months_of = months_of + (start_date_obj.month - 1)
+            occurrences = months_of.astype('datetime64[D]') + (start_date_obj.day - 1)
+            # Drop days that spilled into the next month (e.g. the 31st in a 30-day month).
+            occurrences = occurrences[occurrences.astype('datetime64[M]') == months_of]
+
+        occurrences = occurrences[(occurrences >= first) & (occurrences <= last)]
+        for current_date_obj in occurrences.tolist():
+            if (current_date_obj.year, current_date_obj.month) in printed:
+                _add_occurrence(index, current_date_obj, description)
+
+def draw_events_for_date(text, month_events, day_date, x, y, cell_width, cell_height):
+    """
+    Adds events for a given date to a text object.  Handles stacking and basic truncation.
+
+    Args:
+        text: Reportlab text object, with the event font and line leading already set
+        month_events: Dict of date -> descriptions for this month, from build_event_index
+        day_date: date object of day to render
+        x: top-left x
+        y: top-left y
+        cell_width: Day cell width
+        cell_height: Day cell height
+
+    """
+    event_strings = month_events.get(day_date, ()) # Array of strings to write
+    if not event_strings:
+        return
+
+    #Now draw the events.  The first event sits at the bottom and later ones stack upwards,
+    #so start at the top line and write them in reverse.
+    y_offset = 0.1 * INCH + 0.15 * INCH * (len(event_strings) - 1)
+    text.setTextOrigin(x + 0.1*INCH, y + y_offset)
+    text.textLines(event_strings[::-1])
 
 
-            current_date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
 
-            if start_date_obj <= current_date_obj and (end_date_obj is None or current_date_obj <= end_date_obj):
-                recurrence_num = int(event['recurrence'][:-1])
-                recurrence_unit = event['recurrence'][-1]
+def render_month(year, month, month_events, pagesize, geom):
+    """Renders one month as a standalone one-page PDF and returns its bytes."""
+    from reportlab.pdfgen import canvas
+
+    buf = BytesIO()
+    c = canvas.Canvas(buf, pagesize=pagesize)
+    create_calendar_page(c, year, month, month_events, geom)
+    c.showPage()
+    c.save()
+    return buf.getvalue()
 
-                difference = current_date_obj - start_date_obj
+def _available_cpus():
+    """Returns the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # sched_getaffinity is Linux-only
+        return os.cpu_count() or 1
 
-                if recurrence_unit == 'w':
-                    if difference.days % (recurrence_num*7) == 0:
-                        event_strings.append(event['description'])
-                elif recurrence_unit == 'm':
-                    #For monthly, we want same *day number*.  So, 5th of every month.
-                    if current_date_obj.day == start_date_obj.day:
-                        #Calculate number of months different.  Can't use days difference.
-                        month_diff = (current_date_obj.year - start_date_obj.year) * 12 + (current_date_obj.month - start_date_obj.month)
-                        if month_diff % recurrence_num == 0:
-                            event_strings.append(event['description'])
-                elif recurrence_unit == 'y':
-                    if current_date_obj.month == start_date_obj.month and current_date_obj.day == start_date_obj.day:
-                         year_diff = current_date_obj.year - start_date_obj.year
-                         if year_diff % recurrence_num == 0:
-                             event_strings.append(event['description'])
+def render_months_parallel(months, event_index, pagesize, geom, jobs):
+    """
+    Renders each month in a process pool and merges the pages with pypdf.
 
-    #Now draw the events.
-    canvas.setFont("Helvetica", 8)  # Changed font size to 8
-    y_offset = 0.1 * inch  # Start at bottom
-    for event_str in event_strings:
-        canvas.drawString(x + 0.1*inch, y + y_offset, event_str)
-        y_offset += 0.15 * inch #move up
+    This is opt-in (-j/--jobs): pypdf's import and merge, plus one canvas per month, cost more
+    than a serial single-canvas render for typical calendars, and the merged PDF is larger.
 
+    Args:
+        months: List of (year, month) tuples, in page order
+        event_index: Dict from build_event_index
+        pagesize: (width, height) of each page
+        geom: PageGeom from make_page_geom
+        jobs: Maximum number of worker processes
+
+    Returns:
+        A pypdf.PdfWriter holding every page in order, or None if the months should be
+        rendered serially instead (too few months, pypdf missing, or no process pool).
+    """
+    if jobs <= 1 or len(months) < MIN_MONTHS_FOR_POOL:
+        return None
+    pypdf = _import_optional('pypdf')
+    if pypdf is None:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
 
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(months))) as pool:
+            pages = list(pool.map(
+                render_month,
+                *zip(*[(year, month, event_index.get((year, month), {}), pagesize, geom) for year, month in months])))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return None  # Process pools aren't available here (e.g. no sem_open); render serially.
+
+    writer = pypdf.PdfWriter()
+    for page in pages:
+        writer.append(BytesIO(page))
+    return writer
 
 # --- Main Script ---
 
@@ -245,8 +572,15 @@ def main():
     parser.add_argument("config_file", nargs='?', help="Path to the YAML configuration file.")
     parser.add_argument("--template", action="store_true", help="Generate a template YAML config file.")
     parser.add_argument("-o", "--output", default="calendar.pdf", help="Output PDF filename (default: calendar.pdf)") #Added output
+    parser.add_argument("--strict", action="store_true", help="Stop validating the config file at the first error.")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Worker processes for rendering months, 0 for one per available CPU; needs pypdf. "
+                             "Usually slower than the default serial render (default: 1)")
     args = parser.parse_args()
 
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (one per available CPU) or a positive number of workers.")
+
     if args.template:
         create_template_config()
         return
@@ -255,33 +589,65 @@ def main():
         parser.error("You must specify a config file or use --template.")
 
     # --- Config File Loading ---
-    try:
-        with open(args.config_file, 'r') as f:
-            config = yaml.safe_load(f)
-    except FileNotFoundError:
-        print(f"Error: Config file not found: {args.config_file}")
-        return
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML config file: {e}")
-        return
-
-    # --- Config Validation ---
-    validation_errors = validate_config(config)
-    if validation_errors:
-        print("Errors in config file:")
-        for error in validation_errors:
-            print(f"- {error}")
-        return
+    # A cache hit was validated when it was written, so it skips validation.
+    config = load_cached_config(args.config_file)
+    if config is None:
+        import yaml
+        # Prefer the LibYAML C bindings when PyYAML was built with them.
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+
+        try:
+            with open(args.config_file, 'r') as f:
+                source_mtime = os.fstat(f.fileno()).st_mtime
+                config = yaml.load(f, Loader=Loader)
+        except FileNotFoundError:
+            print(f"Error: Config file not found: {args.config_file}")
+            return
+        except yaml.YAMLError as e:
+            print(f"Error parsing YAML config file: {e}")
+            return
+
+        # --- Config Validation ---
+        validation_errors = validate_config(config, fail_fast=args.strict)
+        if validation_errors:
+            print("Errors in config file:")
+            for error in validation_errors:
+                print(f"- {error}")
+            return
+
+        write_cached_config(args.config_file, config, source_mtime)
+
+    prepare_events(config['events'])
 
     # --- PDF Generation ---
-    c = canvas.Canvas(args.output, pagesize=landscape(letter)) #Use output here
-
-    for month_str in config['months_to_print']:
-        year, month = map(int, month_str.split('-'))
-        create_calendar_page(c, year, month, config['events'])
-        c.showPage()  # Finish the current page and start a new one
-
-    c.save()
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.pdfgen import canvas
+
+    event_index = build_event_index(config['events'], config['months_to_print'])
+    months = [tuple(map(int, month_str.split('-'))) for month_str in config['months_to_print']]
+    pagesize = landscape(letter)
+    geom = make_page_geom(pagesize)
+    jobs = args.jobs if args.jobs != 0 else _available_cpus()
+    merged = render_months_parallel(months, event_index, pagesize, geom, jobs)
+
+    # The output file is only opened once the whole document is built, so a failed render
+    # leaves any existing file untouched.
+    if merged is not None:
+        buf = BytesIO()
+        merged.write(buf)
+        with open(args.output, 'wb') as fp:
+            fp.write(buf.getvalue())
+    else:
+        c = canvas.Canvas(args.output, pagesize=pagesize) #Use output here
+
+        for year, month in months:
+            create_calendar_page(c, year, month, event_index.get((year, month), {}), geom)
+            c.showPage()  # Finish the current page and start a new one
+
+        c.save()  # Writes the file in one go
     print(f"Calendar PDF generated: {args.output}") #Use variable here
 
 if __name__ == "__main__":